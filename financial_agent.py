@@ -5,10 +5,18 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 TRACKED_TOPICS = [
     "AI software",
@@ -30,6 +38,18 @@ TOPIC_COMPANIES: dict[str, list[str]] = {
     "Robotics": ["ABB", "Fanuc", "Yaskawa", "Teradyne", "Rockwell Automation"],
 }
 
+
+def _invert_topics(topic_companies: dict[str, list[str]]) -> dict[str, tuple[str, ...]]:
+    index: dict[str, list[str]] = {}
+    for topic, companies in topic_companies.items():
+        for company in companies:
+            index.setdefault(company, []).append(topic)
+    return {company: tuple(topics) for company, topics in index.items()}
+
+
+# Reverse index for O(1) company -> topics lookups, built once at import.
+COMPANY_TO_TOPICS = _invert_topics(TOPIC_COMPANIES)
+
 DEFAULT_SOURCES = [
     "https://x.com/",
     "https://www.reuters.com/",
@@ -39,7 +59,7 @@ DEFAULT_SOURCES = [
     "https://www.cnbc.com/",
 ]
 
-POSITIVE_CUES = {
+POSITIVE_CUES = frozenset(map(sys.intern, {
     "beats",
     "beat",
     "surge",
@@ -50,9 +70,9 @@ POSITIVE_CUES = {
     "funding secured",
     "margin expansion",
     "record revenue",
-}
+}))
 
-NEGATIVE_CUES = {
+NEGATIVE_CUES = frozenset(map(sys.intern, {
     "miss",
     "delay",
     "lawsuit",
@@ -63,9 +83,9 @@ NEGATIVE_CUES = {
     "cuts guidance",
     "cash burn",
     "dilution",
-}
+}))
 
-HIGH_SIGNAL_CUES = {
+HIGH_SIGNAL_CUES = frozenset(map(sys.intern, {
     "earnings",
     "guidance",
     "regulatory",
@@ -75,10 +95,10 @@ HIGH_SIGNAL_CUES = {
     "capex",
     "supply agreement",
     "government award",
-}
+}))
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     topic: str
     company: str
@@ -87,7 +107,7 @@ class Observation:
     summary: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Assessment:
     observation: Observation
     impact: str
@@ -95,15 +115,126 @@ class Assessment:
     reason: str
 
 
+def _word_bounded(text: str, start: int, end: int) -> bool:
+    """True when text[start:end + 1] is not embedded in a larger word."""
+    before = text[start - 1] if start else ""
+    after = text[end + 1] if end + 1 < len(text) else ""
+    return not (before.isalnum() or before == "_") and not (after.isalnum() or after == "_")
+
+
+def _build_cue_categorizer() -> Callable[[str], list[tuple[int, str]]]:
+    """Build a matcher that finds and labels every cue in a text in one pass.
+
+    Uses an Aho-Corasick automaton carrying (category, cue) payloads when
+    pyahocorasick is installed; otherwise one compiled regex with a named
+    group per cue, so CPython's C regex engine both finds each hit and tells
+    us its category via ``lastgroup`` — no Python-level lookup per hit.
+
+    Both paths use the same semantics: cues match only at word boundaries
+    (so "upbeat" does not register "beat"), at each start position only the
+    longest cue counts (so "beats" does not also register "beat"), and cues
+    starting at different positions may overlap (so "cuts guidance" still
+    registers "guidance").
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for cue, category in _CUE_CATEGORY.items():
+            automaton.add_word(cue, (category, cue))
+        automaton.make_automaton()
+
+        def match(text: str) -> list[tuple[int, str]]:
+            # Automaton.iter reports every cue ending at each offset; keep
+            # word-bounded hits and only the longest cue per start, to
+            # mirror the regex fallback.
+            best: dict[int, tuple[int, str]] = {}
+            for end, (category, cue) in automaton.iter(text):
+                start = end - len(cue) + 1
+                if not _word_bounded(text, start, end):
+                    continue
+                prev = best.get(start)
+                if prev is None or len(cue) > len(prev[1]):
+                    best[start] = (category, cue)
+            return list(dict.fromkeys(best[start] for start in sorted(best)))
+
+        return match
+
+    # The lookahead keeps overlapping matches (e.g. "guidance" inside
+    # "cuts guidance"), which a plain alternation would swallow. Longest-first
+    # ordering makes the alternation prefer whole cues.
+    group_info: dict[str, tuple[int, str]] = {}
+    groups = []
+    for i, cue in enumerate(sorted(_CUE_CATEGORY, key=len, reverse=True)):
+        name = f"c{i}"
+        group_info[name] = (_CUE_CATEGORY[cue], cue)
+        groups.append(rf"(?P<{name}>\b{re.escape(cue)}\b)")
+    pattern = re.compile("(?=" + "|".join(groups) + ")")
+
+    def match(text: str) -> list[tuple[int, str]]:
+        return list(dict.fromkeys(group_info[m.lastgroup] for m in pattern.finditer(text)))
+
+    return match
+
+
+# Cue categories as small ints so one scan can label every hit.
+_CAT_POSITIVE, _CAT_NEGATIVE, _CAT_HIGH_SIGNAL = 0, 1, 2
+
+_CUE_CATEGORY: dict[str, int] = {
+    **{cue: _CAT_POSITIVE for cue in POSITIVE_CUES},
+    **{cue: _CAT_NEGATIVE for cue in NEGATIVE_CUES},
+    **{cue: _CAT_HIGH_SIGNAL for cue in HIGH_SIGNAL_CUES},
+}
+
+_ALL_CUE_MATCHER = _build_cue_categorizer()
+
+# Screen sets for the no-cues common case: single-word cues are checked with
+# one C-level set intersection against the text's words, and the few
+# multi-word cues with plain substring tests. Splitting on non-word
+# characters makes the screen see exactly the words the matcher's \b
+# boundaries delimit, so it never skips a text the matcher would hit.
+_SINGLE_WORD_CUES = frozenset(cue for cue in _CUE_CATEGORY if " " not in cue)
+_MULTI_WORD_CUES = tuple(cue for cue in _CUE_CATEGORY if " " in cue)
+_WORD_SPLIT_RE = re.compile(r"[^a-z0-9_]+")
+
+
+@lru_cache(maxsize=4096)
+def _cue_hits(text: str) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """Scan ``text`` once and partition every cue hit by category code."""
+    # Early exit when no cue can match; cues embedded inside larger words
+    # ("beat" in "upbeat") do not count, matching the matcher's boundaries.
+    words = set(_WORD_SPLIT_RE.split(text))
+    if _SINGLE_WORD_CUES.isdisjoint(words) and not any(cue in text for cue in _MULTI_WORD_CUES):
+        return (), (), ()
+
+    hits: tuple[list[str], list[str], list[str]] = ([], [], [])
+    for category, cue in _ALL_CUE_MATCHER(text):
+        hits[category].append(cue)
+    return tuple(tuple(category) for category in hits)
+
+
+# Credible-source detection as one compiled literal alternation: a single
+# C-level scan of the source instead of one Python "in" test per domain.
+_CREDIBLE_SOURCE_RE = re.compile(r"reuters|bloomberg|ft\.com|wsj|cnbc")
+
+
 def normalize(text: str) -> str:
     return text.strip().lower()
 
 
-def classify_impact(summary: str) -> tuple[str, str]:
-    text = normalize(summary)
-    pos_hits = [cue for cue in POSITIVE_CUES if cue in text]
-    neg_hits = [cue for cue in NEGATIVE_CUES if cue in text]
+@lru_cache(maxsize=4096)
+def classify_impact(text: str) -> tuple[str, str]:
+    """Classify an already-normalized (lowercase) summary.
+
+    Memoized: noisy feeds repeat identical summaries (re-posts, duplicate
+    items), and a repeat costs a dict lookup instead of a scan.
+
+    The cue sets are stored lowercase, so callers are expected to pass text
+    through :func:`normalize` first; ``assess`` does this once per observation.
+    """
+    pos_hits, neg_hits, _ = _cue_hits(text)
+    return _impact_from_hits(pos_hits, neg_hits)
 
+
+def _impact_from_hits(pos_hits: tuple[str, ...], neg_hits: tuple[str, ...]) -> tuple[str, str]:
     if len(pos_hits) > len(neg_hits):
         return "positive", f"positive cues: {', '.join(pos_hits)}"
     if len(neg_hits) > len(pos_hits):
@@ -111,21 +242,27 @@ def classify_impact(summary: str) -> tuple[str, str]:
     return "mixed/unclear", "insufficient directional evidence"
 
 
-def signal_score(summary: str, source: str) -> tuple[int, str]:
-    text = normalize(summary)
+@lru_cache(maxsize=4096)
+def signal_score(text: str, source_l: str) -> tuple[int, str]:
+    """Score an already-normalized (lowercase) summary and source.
+
+    Memoized for the same reason as :func:`classify_impact`.
+    """
+    return _score_from_hits(_cue_hits(text)[_CAT_HIGH_SIGNAL], source_l)
+
+
+def _score_from_hits(high_hits: tuple[str, ...], source_l: str) -> tuple[int, str]:
     score = 0
     reasons: list[str] = []
 
-    cue_hits = [cue for cue in HIGH_SIGNAL_CUES if cue in text]
-    if cue_hits:
-        score += min(3, len(cue_hits))
-        reasons.append(f"hard catalysts: {', '.join(cue_hits)}")
+    if high_hits:
+        score += min(3, len(high_hits))
+        reasons.append(f"hard catalysts: {', '.join(high_hits)}")
 
-    source_l = normalize(source)
     if "x.com" in source_l:
         score += 1
         reasons.append("fast signal source (x.com)")
-    elif any(domain in source_l for domain in ("reuters", "bloomberg", "ft.com", "wsj", "cnbc")):
+    elif _CREDIBLE_SOURCE_RE.search(source_l):
         score += 2
         reasons.append("high-credibility financial source")
 
@@ -135,8 +272,11 @@ def signal_score(summary: str, source: str) -> tuple[int, str]:
 def assess(observations: Iterable[Observation]) -> list[Assessment]:
     assessed: list[Assessment] = []
     for obs in observations:
-        impact, impact_reason = classify_impact(obs.summary)
-        score, signal_reason = signal_score(obs.summary, obs.source)
+        text = normalize(obs.summary)
+        source_l = normalize(obs.source)
+        pos_hits, neg_hits, high_hits = _cue_hits(text)
+        impact, impact_reason = _impact_from_hits(pos_hits, neg_hits)
+        score, signal_reason = _score_from_hits(high_hits, source_l)
         reason = f"{impact_reason}; {signal_reason}"
         assessed.append(Assessment(observation=obs, impact=impact, signal_score=score, reason=reason))
 
@@ -145,7 +285,7 @@ def assess(observations: Iterable[Observation]) -> list[Assessment]:
 
 def render_report(assessments: list[Assessment]) -> str:
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-    lines = [
+    header = [
         f"Daily Frontier Research Brief ({now})",
         "",
         "Principles: skeptical, concise, capital-scarce, opportunity-cost aware.",
@@ -153,28 +293,26 @@ def render_report(assessments: list[Assessment]) -> str:
     ]
 
     if not assessments:
-        lines.append("No observations supplied.")
-        return "\n".join(lines)
-
-    for idx, item in enumerate(assessments, start=1):
-        obs = item.observation
-        lines.extend(
-            [
-                f"{idx}. [{obs.topic}] {obs.company} -> {item.impact.upper()} (signal {item.signal_score}/5)",
-                f"   Why: {item.reason}.",
-                f"   Source: {obs.source} ({obs.url})",
-            ]
+        return "\n".join(header + ["No observations supplied."])
+
+    body = [
+        line
+        for idx, item in enumerate(assessments, start=1)
+        for obs in (item.observation,)
+        for line in (
+            f"{idx}. [{obs.topic}] {obs.company} -> {item.impact.upper()} (signal {item.signal_score}/5)",
+            f"   Why: {item.reason}.",
+            f"   Source: {obs.source} ({obs.url})",
         )
+    ]
 
-    lines.extend(
-        [
-            "",
-            "Action filter:",
-            "- Focus only on items with signal >=3 and clear positive/negative direction.",
-            "- Ignore narrative-only items without earnings, regulation, supply, or contract implications.",
-        ]
-    )
-    return "\n".join(lines)
+    footer = [
+        "",
+        "Action filter:",
+        "- Focus only on items with signal >=3 and clear positive/negative direction.",
+        "- Ignore narrative-only items without earnings, regulation, supply, or contract implications.",
+    ]
+    return "\n".join(header + body + footer)
 
 
 def load_observations(path: Path) -> list[Observation]:
@@ -183,26 +321,26 @@ def load_observations(path: Path) -> list[Observation]:
 
 
 def print_bootstrap_guide() -> None:
-    print("Financial Analysis AI Agent - Daily Bootstrap")
-    print("")
-    print("Tracked topics:")
-    for topic in TRACKED_TOPICS:
-        print(f"- {topic}")
-
-    print("\nPriority source set:")
-    for src in DEFAULT_SOURCES:
-        print(f"- {src}")
-
-    print("\nMajor companies to monitor:")
-    for topic, companies in TOPIC_COMPANIES.items():
-        print(f"- {topic}: {', '.join(companies)}")
-
-    print("\nWorkflow:")
-    print("1) Collect 3-8 high-signal observations per topic from x.com + financial press.")
-    print("2) Reject rumor-only claims without filings, contracts, guidance, or regulator actions.")
-    print("3) Classify impact: positive / negative / mixed.")
-    print("4) Rank by signal strength and opportunity cost.")
-    print("5) Produce a short watchlist and what to ignore.")
+    lines = [
+        "Financial Analysis AI Agent - Daily Bootstrap",
+        "",
+        "Tracked topics:",
+        *(f"- {topic}" for topic in TRACKED_TOPICS),
+        "",
+        "Priority source set:",
+        *(f"- {src}" for src in DEFAULT_SOURCES),
+        "",
+        "Major companies to monitor:",
+        *(f"- {topic}: {', '.join(companies)}" for topic, companies in TOPIC_COMPANIES.items()),
+        "",
+        "Workflow:",
+        "1) Collect 3-8 high-signal observations per topic from x.com + financial press.",
+        "2) Reject rumor-only claims without filings, contracts, guidance, or regulator actions.",
+        "3) Classify impact: positive / negative / mixed.",
+        "4) Rank by signal strength and opportunity cost.",
+        "5) Produce a short watchlist and what to ignore.",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def build_parser() -> argparse.ArgumentParser:
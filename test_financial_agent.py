@@ -1,4 +1,4 @@
-from financial_agent import Observation, assess, render_report
+from financial_agent import Observation, _cue_hits, assess, render_report
 
 
 def test_assess_ranks_high_signal_and_negative() -> None:
@@ -26,6 +26,27 @@ def test_assess_ranks_high_signal_and_negative() -> None:
     assert assessments[1].impact == "negative"
 
 
+def test_cue_hits_counts_longest_cue_per_position() -> None:
+    pos_hits, neg_hits, _ = _cue_hits("company beats estimates but lawsuit looms.")
+
+    assert pos_hits == ("beats",)
+    assert neg_hits == ("lawsuit",)
+
+
+def test_cue_hits_ignores_cues_embedded_in_larger_words() -> None:
+    assert _cue_hits("upbeat outlook for the quarter.") == ((), (), ())
+
+    pos_hits, _, _ = _cue_hits("drumbeat of growth continues.")
+    assert pos_hits == ("growth",)
+
+
+def test_cue_hits_keeps_overlaps_at_different_positions() -> None:
+    _, neg_hits, high_hits = _cue_hits("management cuts guidance for the year")
+
+    assert "cuts guidance" in neg_hits
+    assert "guidance" in high_hits
+
+
 def test_render_report_contains_action_filter() -> None:
     observations = [
         Observation(
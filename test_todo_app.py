@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 from todo_app import TodoStore
@@ -23,3 +24,71 @@ def test_add_list_complete_delete(tmp_path: Path) -> None:
     reloaded = TodoStore(path=db)
     assert len(reloaded.list_items()) == 1
     assert reloaded.list_items()[0].done is True
+
+
+def test_mutations_replay_from_log_without_snapshot(tmp_path: Path) -> None:
+    db = tmp_path / "todos.json"
+    store = TodoStore(path=db)
+    store.add("Buy milk")
+    store.complete(1)
+
+    assert store.log_path.exists()
+    assert not db.exists()
+
+    reloaded = TodoStore(path=db)
+    assert [item.id for item in reloaded.list_items()] == [1]
+    assert reloaded.get(1).done is True
+
+
+def test_save_truncates_log(tmp_path: Path) -> None:
+    db = tmp_path / "todos.json"
+    store = TodoStore(path=db)
+    store.add("Buy milk")
+
+    store.save()
+    assert not store.log_path.exists()
+
+    reloaded = TodoStore(path=db)
+    assert [item.id for item in reloaded.list_items()] == [1]
+
+
+def test_replay_skips_adds_already_in_snapshot(tmp_path: Path) -> None:
+    db = tmp_path / "todos.json"
+    store = TodoStore(path=db)
+    store.add("Buy milk")
+
+    # Simulate a crash between the snapshot write and the log truncation:
+    # both files now record the same add.
+    db.write_text(json.dumps([{"id": 1, "title": "Buy milk", "done": False}]), encoding="utf-8")
+
+    reloaded = TodoStore(path=db)
+    assert [item.id for item in reloaded.list_items()] == [1]
+
+
+def test_log_compacts_into_snapshot_past_threshold(tmp_path: Path) -> None:
+    db = tmp_path / "todos.json"
+    store = TodoStore(path=db)
+    for i in range(100):
+        store.add(f"Task {i} " + "x" * 100)
+        if db.exists():
+            break
+
+    assert db.exists()
+    assert not store.log_path.exists()
+
+    reloaded = TodoStore(path=db)
+    assert len(reloaded.list_items()) == len(store.list_items())
+
+
+def test_loads_legacy_pretty_printed_snapshot(tmp_path: Path) -> None:
+    db = tmp_path / "todos.json"
+    payload = [
+        {"id": 2, "title": "Older export", "done": True},
+        {"id": 1, "title": "Newer export", "done": False},
+    ]
+    db.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    store = TodoStore(path=db)
+    assert [item.id for item in store.list_items()] == [1, 2]
+    assert store.get(2).done is True
+    assert store.add("Next").id == 3
@@ -4,45 +4,126 @@
 from __future__ import annotations
 
 import argparse
+import gzip
+import html
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Iterable
-from urllib.parse import parse_qs
+from urllib.parse import unquote_to_bytes
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_bytes(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
 
 
 DEFAULT_DB_PATH = Path("todos.json")
 
+# Compact the mutation log into a fresh snapshot once it outgrows both the
+# snapshot and this floor, so tiny stores do not rewrite on every mutation.
+COMPACT_MIN_BYTES = 4096
 
-@dataclass
+
+@dataclass(slots=True)
 class TodoItem:
     id: int
     title: str
     done: bool = False
 
 
+def _item_dict(item: TodoItem) -> dict[str, object]:
+    """Flatten a TodoItem for serialization without dataclasses.asdict.
+
+    asdict recurses and deep-copies every field, which is wasted work for
+    three scalars on the per-mutation persistence path.
+    """
+    return {"id": item.id, "title": item.title, "done": item.done}
+
+
 class TodoStore:
     def __init__(self, path: Path = DEFAULT_DB_PATH):
         self.path = Path(path)
+        self.log_path = self.path.with_suffix(".log")
         self.items: list[TodoItem] = []
+        self._by_id: dict[int, TodoItem] = {}
+        self._max_id: int = 0
+        self.version: int = 0
         self.load()
 
     def load(self) -> None:
-        if not self.path.exists():
-            self.items = []
-            return
-
-        raw = json.loads(self.path.read_text(encoding="utf-8"))
-        self.items = [TodoItem(**row) for row in raw]
+        if self.path.exists():
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+            self._reset(TodoItem(**row) for row in raw)
+        else:
+            self._reset([])
+
+        if self.log_path.exists():
+            with self.log_path.open("r", encoding="utf-8") as fh:
+                for line in fh:
+                    if line.strip():
+                        self._apply(json.loads(line))
+            self._maybe_compact()
+
+    def _reset(self, items: Iterable[TodoItem]) -> None:
+        # Sort once on load; add() only ever appends monotonically increasing
+        # ids, so the list stays ordered from here on.
+        self.items = sorted(items, key=lambda item: item.id)
+        self._by_id = {item.id: item for item in self.items}
+        self._max_id = max(self._by_id, default=0)
 
     def save(self) -> None:
-        payload = [asdict(item) for item in self.items]
-        self.path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        """Write a full snapshot of the store and truncate the mutation log.
+
+        The log must not survive the snapshot: replaying it on top of a
+        snapshot that already contains its mutations would duplicate items.
+        """
+        payload = [_item_dict(item) for item in self.items]
+        self.path.write_bytes(_dump_bytes(payload))
+        self.log_path.unlink(missing_ok=True)
+
+    def _append(self, record: dict[str, object]) -> None:
+        with self.log_path.open("ab") as fh:
+            fh.write(_dump_bytes(record) + b"\n")
+
+    def _apply(self, record: dict) -> None:
+        op = record["op"]
+        if op == "add":
+            item = TodoItem(**record["item"])
+            if item.id in self._by_id:
+                # Snapshot already contains this add (crash between the
+                # snapshot write and the log truncation).
+                return
+            self.items.append(item)
+            self._by_id[item.id] = item
+            self._max_id = max(self._max_id, item.id)
+        elif op == "complete":
+            item = self._by_id.get(record["id"])
+            if item is not None:
+                item.done = True
+        elif op == "delete":
+            item = self._by_id.pop(record["id"], None)
+            if item is not None:
+                self.items.remove(item)
+
+    def _maybe_compact(self) -> None:
+        if not self.log_path.exists():
+            return
+        log_size = self.log_path.stat().st_size
+        snapshot_size = self.path.stat().st_size if self.path.exists() else 0
+        if log_size > max(2 * snapshot_size, COMPACT_MIN_BYTES):
+            self.save()
 
     def _next_id(self) -> int:
-        return max((item.id for item in self.items), default=0) + 1
+        return self._max_id + 1
 
     def add(self, title: str) -> TodoItem:
         title = title.strip()
@@ -51,17 +132,18 @@ class TodoStore:
 
         item = TodoItem(id=self._next_id(), title=title)
         self.items.append(item)
-        self.save()
+        self._by_id[item.id] = item
+        self._max_id = item.id
+        self.version += 1
+        self._append({"op": "add", "item": _item_dict(item)})
+        self._maybe_compact()
         return item
 
     def list_items(self) -> list[TodoItem]:
-        return sorted(self.items, key=lambda item: item.id)
+        return list(self.items)
 
     def get(self, item_id: int) -> TodoItem | None:
-        for item in self.items:
-            if item.id == item_id:
-                return item
-        return None
+        return self._by_id.get(item_id)
 
     def complete(self, item_id: int) -> TodoItem:
         item = self.get(item_id)
@@ -69,7 +151,9 @@ class TodoStore:
             raise KeyError(f"No todo found with ID {item_id}.")
 
         item.done = True
-        self.save()
+        self.version += 1
+        self._append({"op": "complete", "id": item_id})
+        self._maybe_compact()
         return item
 
     def delete(self, item_id: int) -> TodoItem:
@@ -77,13 +161,57 @@ class TodoStore:
         if item is None:
             raise KeyError(f"No todo found with ID {item_id}.")
 
-        self.items = [todo for todo in self.items if todo.id != item_id]
-        self.save()
+        del self._by_id[item_id]
+        self.items.remove(item)
+        self.version += 1
+        self._append({"op": "delete", "id": item_id})
+        self._maybe_compact()
         return item
 
 
+_PAGE_TEMPLATE = """<!doctype html>
+<html>
+  <head>
+    <meta charset=\"utf-8\" />
+    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
+    <title>Todo CLI + Web</title>
+    <style>
+      body { font-family: -apple-system, BlinkMacSystemFont, sans-serif; max-width: 760px; margin: 2rem auto; padding: 0 1rem; }
+      h1 { margin-bottom: 0.5rem; }
+      .card { border: 1px solid #ddd; border-radius: 8px; padding: 1rem; margin-top: 1rem; }
+      .row { display: flex; align-items: center; justify-content: space-between; gap: 1rem; border-top: 1px solid #eee; padding: 0.75rem 0; }
+      .row:first-child { border-top: none; }
+      .done { color: #777; text-decoration: line-through; }
+      input[type=text] { width: 100%; max-width: 460px; padding: 0.5rem; }
+      button { padding: 0.4rem 0.6rem; cursor: pointer; }
+      form.inline { display: inline; }
+    </style>
+  </head>
+  <body>
+    <h1>Todo App</h1>
+    <p>Use this in your browser, or run commands in terminal.</p>
+    <div class=\"card\">
+      <form method=\"post\" action=\"/add\">
+        <input type=\"text\" name=\"title\" placeholder=\"What do you need to do?\" required />
+        <button type=\"submit\">Add</button>
+      </form>
+    </div>
+    <div class=\"card\">
+      {rows}
+    </div>
+  </body>
+</html>
+"""
+
+# Static page shell pre-encoded once so a response only encodes the rows.
+_PAGE_HEAD, _, _PAGE_TAIL = (part.encode("utf-8") for part in _PAGE_TEMPLATE.partition("{rows}"))
+
+
 class TodoRequestHandler(BaseHTTPRequestHandler):
     store: TodoStore
+    # Rendered page cache shared across requests:
+    # (store version, body, gzipped body).
+    _cache: tuple[int, bytes, bytes] | None = None
 
     def do_GET(self) -> None:  # noqa: N802 - method name required by BaseHTTPRequestHandler
         if self.path != "/":
@@ -93,16 +221,15 @@ class TodoRequestHandler(BaseHTTPRequestHandler):
 
     def do_POST(self) -> None:  # noqa: N802 - method name required by BaseHTTPRequestHandler
         content_length = int(self.headers.get("Content-Length", "0"))
-        body = self.rfile.read(content_length).decode("utf-8")
-        form = parse_qs(body)
+        body = self.rfile.read(content_length)
 
         try:
             if self.path == "/add":
-                self.store.add(form.get("title", [""])[0])
+                self.store.add(_first_field(body, b"title"))
             elif self.path == "/complete":
-                self.store.complete(int(form.get("id", ["0"])[0]))
+                self.store.complete(int(_first_field(body, b"id") or "0"))
             elif self.path == "/delete":
-                self.store.delete(int(form.get("id", ["0"])[0]))
+                self.store.delete(int(_first_field(body, b"id") or "0"))
             else:
                 self.send_error(HTTPStatus.NOT_FOUND, "Not found")
                 return
@@ -117,67 +244,46 @@ class TodoRequestHandler(BaseHTTPRequestHandler):
         return
 
     def _render_home(self) -> None:
-        items = self.store.list_items()
-        rows = "\n".join(_render_item(item) for item in items) or "<p>No todos yet.</p>"
-        html = f"""<!doctype html>
-<html>
-  <head>
-    <meta charset=\"utf-8\" />
-    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-    <title>Todo CLI + Web</title>
-    <style>
-      body {{ font-family: -apple-system, BlinkMacSystemFont, sans-serif; max-width: 760px; margin: 2rem auto; padding: 0 1rem; }}
-      h1 {{ margin-bottom: 0.5rem; }}
-      .card {{ border: 1px solid #ddd; border-radius: 8px; padding: 1rem; margin-top: 1rem; }}
-      .row {{ display: flex; align-items: center; justify-content: space-between; gap: 1rem; border-top: 1px solid #eee; padding: 0.75rem 0; }}
-      .row:first-child {{ border-top: none; }}
-      .done {{ color: #777; text-decoration: line-through; }}
-      input[type=text] {{ width: 100%; max-width: 460px; padding: 0.5rem; }}
-      button {{ padding: 0.4rem 0.6rem; cursor: pointer; }}
-      form.inline {{ display: inline; }}
-    </style>
-  </head>
-  <body>
-    <h1>Todo App</h1>
-    <p>Use this in your browser, or run commands in terminal.</p>
-    <div class=\"card\">
-      <form method=\"post\" action=\"/add\">
-        <input type=\"text\" name=\"title\" placeholder=\"What do you need to do?\" required />
-        <button type=\"submit\">Add</button>
-      </form>
-    </div>
-    <div class=\"card\">
-      {rows}
-    </div>
-  </body>
-</html>
-"""
-        data = html.encode("utf-8")
+        cached = TodoRequestHandler._cache
+        if cached is None or cached[0] != self.store.version:
+            items = self.store.list_items()
+            rows = tuple(_render_item(item).encode("utf-8") for item in items)
+            # Join once per mutation; wfile is unbuffered, so each response
+            # must go out as a single write to stay one syscall.
+            body = b"".join((_PAGE_HEAD, *(rows or (b"<p>No todos yet.</p>",)), _PAGE_TAIL))
+            gz = gzip.compress(body, compresslevel=6)
+            cached = (self.store.version, body, gz)
+            TodoRequestHandler._cache = cached
+        _, body, gz = cached
+
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            data, encoding = gz, "gzip"
+        else:
+            data, encoding = body, None
         self.send_response(HTTPStatus.OK)
         self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
         self.send_header("Content-Length", str(len(data)))
         self.end_headers()
         self.wfile.write(data)
 
 
-def _render_item(item: TodoItem) -> str:
-    label_class = "done" if item.done else ""
-    complete_button = (
-        "" if item.done else f"""
+_COMPLETE_BUTTON_TEMPLATE = """
         <form method=\"post\" action=\"/complete\" class=\"inline\">
-          <input type=\"hidden\" name=\"id\" value=\"{item.id}\" />
+          <input type=\"hidden\" name=\"id\" value=\"{id}\" />
           <button type=\"submit\">Done</button>
         </form>
         """
-    )
 
-    return f"""
+_ROW_TEMPLATE = """
     <div class=\"row\">
-      <div><strong>#{item.id}</strong> <span class=\"{label_class}\">{item.title}</span></div>
+      <div><strong>#{id}</strong> <span class=\"{label_class}\">{title}</span></div>
       <div>
         {complete_button}
         <form method=\"post\" action=\"/delete\" class=\"inline\">
-          <input type=\"hidden\" name=\"id\" value=\"{item.id}\" />
+          <input type=\"hidden\" name=\"id\" value=\"{id}\" />
           <button type=\"submit\">Delete</button>
         </form>
       </div>
@@ -185,6 +291,31 @@ def _render_item(item: TodoItem) -> str:
     """
 
 
+def _render_item(item: TodoItem) -> str:
+    return _ROW_TEMPLATE.format(
+        id=item.id,
+        title=html.escape(item.title),
+        label_class="done" if item.done else "",
+        complete_button="" if item.done else _COMPLETE_BUTTON_TEMPLATE.format(id=item.id),
+    )
+
+
+def _first_field(body: bytes, key: bytes) -> str:
+    """Return the first value for ``key`` in a urlencoded form body.
+
+    The three POST endpoints each read a single field, so this skips the
+    full dict-of-lists that urllib.parse.parse_qs would build per request.
+    """
+    prefix = key + b"="
+    for pair in body.split(b"&"):
+        if pair.startswith(prefix):
+            # Unquote before decoding so raw UTF-8 bytes in the body (which
+            # some clients send un-percent-encoded) survive the round trip.
+            value = unquote_to_bytes(pair[len(prefix):].replace(b"+", b" "))
+            return value.decode("utf-8", errors="replace")
+    return ""
+
+
 def print_items(items: Iterable[TodoItem]) -> None:
     rows = list(items)
     if not rows: